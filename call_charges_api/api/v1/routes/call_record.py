@@ -1,11 +1,17 @@
 from http import HTTPStatus
-from typing import Dict
+from typing import Annotated, AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from call_charges_api.api.v1.errors.error_handlers import handle_error
 from call_charges_api.api.v1.schemas.call_record import (
+    CallRecordBatchErrorSchema,
+    CallRecordBatchItemSchema,
+    CallRecordBatchResponseSchema,
     CallRecordRequestSchema,
     CallRecordResponseSchema,
 )
@@ -15,7 +21,12 @@ from call_charges_api.domain.use_cases.register_call import (
 from call_charges_api.domain.use_cases.register_call import (
     RegisterCallUseCase,
 )
+from call_charges_api.domain.use_cases.register_call_batch import (
+    ItemOutput,
+    RegisterCallBatchUseCase,
+)
 from call_charges_api.infra.config.security import get_current_user
+from call_charges_api.infra.config.settings import Settings
 from call_charges_api.infra.db.session import get_session
 from call_charges_api.infra.sqlalchemy_repos.sqlalchemy_call_record_repository import (  # noqa: E501
     SQLAlchemyCallRecordRepository,
@@ -64,3 +75,192 @@ def register_call(
     except Exception as e:
         print(e)
         raise handle_error(e)
+
+
+@router.put(
+    '/call_records:batch',
+    status_code=HTTPStatus.OK,
+    response_model=CallRecordBatchResponseSchema,
+)
+def register_call_batch(
+    call_record_schemas: List[CallRecordRequestSchema],
+    session: Session = Depends(get_session),
+    _: Dict = Depends(get_current_user),
+):
+    call_record_repo = SQLAlchemyCallRecordRepository(session)
+    phone_bill_repo = SQLAlchemyPhoneBillRepository(session)
+    use_case = RegisterCallBatchUseCase(call_record_repo, phone_bill_repo)
+
+    try:
+        items = use_case.execute([
+            _to_register_call_input(call_record_schema)
+            for call_record_schema in call_record_schemas
+        ])
+    except Exception as e:
+        print(e)
+        raise handle_error(e)
+
+    return CallRecordBatchResponseSchema(
+        results=[_to_batch_item_schema(item, item.index) for item in items]
+    )
+
+
+@router.post(
+    '/call_records:stream',
+    status_code=HTTPStatus.OK,
+    response_class=StreamingResponse,
+)
+async def register_call_stream(
+    request: Request,
+    chunk_size: Annotated[Optional[int], Query(gt=0)] = None,
+    session: Session = Depends(get_session),
+    _: Dict = Depends(get_current_user),
+):
+    call_record_repo = SQLAlchemyCallRecordRepository(session)
+    phone_bill_repo = SQLAlchemyPhoneBillRepository(session)
+    use_case = RegisterCallBatchUseCase(call_record_repo, phone_bill_repo)
+
+    return StreamingResponse(
+        _register_call_lines(
+            request.stream(),
+            use_case,
+            session,
+            chunk_size or Settings().CALL_RECORDS_STREAM_CHUNK_SIZE,
+        ),
+        media_type='application/x-ndjson',
+    )
+
+
+async def _register_call_lines(
+    body: AsyncIterator[bytes],
+    use_case: RegisterCallBatchUseCase,
+    session: Session,
+    chunk_size: int,
+) -> AsyncIterator[str]:
+    chunk = []
+
+    async for index, line in _iter_lines(body):
+        try:
+            chunk.append((
+                index,
+                CallRecordRequestSchema.model_validate_json(line),
+            ))
+        except ValidationError as e:
+            chunk.append((
+                index,
+                CallRecordBatchItemSchema(
+                    index=index,
+                    error=CallRecordBatchErrorSchema(
+                        status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                        error='ValidationError',
+                        message=str(e),
+                    ),
+                ),
+            ))
+
+        if len(chunk) >= chunk_size:
+            for item in await run_in_threadpool(
+                _register_call_chunk, chunk, use_case, session
+            ):
+                yield item.model_dump_json() + '\n'
+            chunk = []
+
+    if chunk:
+        for item in await run_in_threadpool(
+            _register_call_chunk, chunk, use_case, session
+        ):
+            yield item.model_dump_json() + '\n'
+
+
+def _register_call_chunk(
+    chunk: List[tuple],
+    use_case: RegisterCallBatchUseCase,
+    session: Session,
+) -> List[CallRecordBatchItemSchema]:
+    schemas = [
+        (index, schema)
+        for index, schema in chunk
+        if isinstance(schema, CallRecordRequestSchema)
+    ]
+
+    try:
+        items = use_case.execute([
+            _to_register_call_input(schema) for _, schema in schemas
+        ])
+        results = {
+            index: _to_batch_item_schema(item, index)
+            for (index, _), item in zip(schemas, items)
+        }
+    except Exception as e:
+        print(e)
+        session.rollback()
+        http_error = handle_error(e)
+        results = {
+            index: CallRecordBatchItemSchema(
+                index=index,
+                error=CallRecordBatchErrorSchema(
+                    status_code=http_error.status_code, **http_error.detail
+                ),
+            )
+            for index, _ in schemas
+        }
+
+    return [
+        results[index] if index in results else schema
+        for index, schema in chunk
+    ]
+
+
+async def _iter_lines(body: AsyncIterator[bytes]):
+    buffer = b''
+    index = 0
+
+    async for data in body:
+        buffer += data
+        *lines, buffer = buffer.split(b'\n')
+
+        for line in lines:
+            if line.strip():
+                yield index, line
+            index += 1
+
+    if buffer.strip():
+        yield index, buffer
+
+
+def _to_register_call_input(
+    call_record_schema: CallRecordRequestSchema,
+) -> RegisterCallInput:
+    return RegisterCallInput(
+        id=call_record_schema.id,
+        call_type=call_record_schema.type,
+        timestamp=call_record_schema.timestamp,
+        call_id=call_record_schema.call_id,
+        source=call_record_schema.source,
+        destination=call_record_schema.destination,
+    )
+
+
+def _to_batch_item_schema(
+    item: ItemOutput, index: int
+) -> CallRecordBatchItemSchema:
+    if item.error:
+        http_error = handle_error(item.error)
+        return CallRecordBatchItemSchema(
+            index=index,
+            error=CallRecordBatchErrorSchema(
+                status_code=http_error.status_code, **http_error.detail
+            ),
+        )
+
+    return CallRecordBatchItemSchema(
+        index=index,
+        record=CallRecordResponseSchema(
+            id=item.record.id,
+            type=item.record.call_type,
+            timestamp=item.record.timestamp,
+            call_id=item.record.call_id,
+            source=item.record.source,
+            destination=item.record.destination,
+        ),
+    )
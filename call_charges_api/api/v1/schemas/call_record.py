@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -23,3 +23,19 @@ class CallRecordResponseSchema(BaseModel):
     call_id: int
     source: Optional[str] = None
     destination: Optional[str] = None
+
+
+class CallRecordBatchErrorSchema(BaseModel):
+    status_code: int
+    error: str
+    message: str
+
+
+class CallRecordBatchItemSchema(BaseModel):
+    index: int
+    record: Optional[CallRecordResponseSchema] = None
+    error: Optional[CallRecordBatchErrorSchema] = None
+
+
+class CallRecordBatchResponseSchema(BaseModel):
+    results: List[CallRecordBatchItemSchema]
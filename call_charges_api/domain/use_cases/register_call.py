@@ -41,6 +41,40 @@ class Output:
     destination: str
 
 
+def build_call_record(input: Input) -> CallRecord:
+    if input.source:
+        input.source = (
+            input.source.replace(' ', '')
+            .replace('-', '')
+            .replace('(', '')
+            .replace(')', '')
+            .replace('+55', '')
+        )
+    if input.destination:
+        input.destination = (
+            input.destination.replace(' ', '')
+            .replace('-', '')
+            .replace('(', '')
+            .replace(')', '')
+            .replace('+55', '')
+        )
+
+    if input.source and input.source == input.destination:
+        raise InvalidPhoneNumberException(input.source)
+
+    call_record = CallRecord(
+        call_id=input.call_id,
+        call_type=input.call_type,
+        timestamp=datetime.fromisoformat(input.timestamp),
+        source=input.source,
+        destination=input.destination,
+    )
+    call_record.validate_call_record()
+    call_record.validate_phone_numbers()
+
+    return call_record
+
+
 class RegisterCallUseCase:
     def __init__(
         self,
@@ -51,35 +85,7 @@ class RegisterCallUseCase:
         self.phone_bill_repository = phone_bill_repository
 
     def execute(self, input: Input) -> Output:
-        if input.source:
-            input.source = (
-                input.source.replace(' ', '')
-                .replace('-', '')
-                .replace('(', '')
-                .replace(')', '')
-                .replace('+55', '')
-            )
-        if input.destination:
-            input.destination = (
-                input.destination.replace(' ', '')
-                .replace('-', '')
-                .replace('(', '')
-                .replace(')', '')
-                .replace('+55', '')
-            )
-
-        if input.source and input.source == input.destination:
-            raise InvalidPhoneNumberException(input.source)
-
-        call_record = CallRecord(
-            call_id=input.call_id,
-            call_type=input.call_type,
-            timestamp=datetime.fromisoformat(input.timestamp),
-            source=input.source,
-            destination=input.destination,
-        )
-        call_record.validate_call_record()
-        call_record.validate_phone_numbers()
+        call_record = build_call_record(input)
 
         contains_start_record = (
             self.call_record_repository.record_start_exists(
@@ -0,0 +1,184 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from call_charges_api.domain.entities.call_record import CallRecord, CallType
+from call_charges_api.domain.errors.exceptions import (
+    BusinessException,
+    StartRecordNotFoundException,
+)
+from call_charges_api.domain.use_cases.register_call import (
+    Input,
+    Output,
+    build_call_record,
+)
+from call_charges_api.repositories.call_record_repository import (
+    CallRecordRepository,
+    RecordInput,
+    RecordOutput,
+    Status,
+)
+from call_charges_api.repositories.phone_bill_repository import (
+    PhoneBillInput,
+    PhoneBillRepository,
+)
+
+
+@dataclass
+class ItemOutput:
+    index: int
+    record: Optional[Output] = None
+    error: Optional[BusinessException] = None
+
+
+class RegisterCallBatchUseCase:
+    def __init__(
+        self,
+        call_record_repository: CallRecordRepository,
+        phone_bill_repository: PhoneBillRepository,
+    ):
+        self.call_record_repository = call_record_repository
+        self.phone_bill_repository = phone_bill_repository
+
+    def execute(self, inputs: List[Input]) -> List[ItemOutput]:
+        results: List[Optional[ItemOutput]] = [None] * len(inputs)
+        call_records: Dict[int, CallRecord] = {}
+
+        for index, input in enumerate(inputs):
+            try:
+                call_records[index] = build_call_record(input)
+            except BusinessException as e:
+                results[index] = ItemOutput(index=index, error=e)
+
+        existing_records = self.call_record_repository.get_many_by_call_ids(
+            list({record.call_id for record in call_records.values()})
+        )
+        records: Dict[Tuple[int, str], RecordInput | RecordOutput] = {
+            (record.call_id, record.call_type): record
+            for record in existing_records
+        }
+        new_records: Dict[Tuple[int, str], RecordInput] = {}
+        changed_records: Dict[Tuple[int, str], RecordOutput] = {}
+        processed: Dict[int, Tuple[Tuple[int, str], datetime]] = {}
+
+        ordered_records = sorted(
+            call_records.items(), key=lambda item: item[1].is_end()
+        )
+
+        for index, call_record in ordered_records:
+            start_key = (call_record.call_id, CallType.START.value)
+            key = (call_record.call_id, call_record.call_type.value)
+
+            if call_record.is_end() and start_key not in records:
+                results[index] = ItemOutput(
+                    index=index,
+                    error=StartRecordNotFoundException(call_record.call_id),
+                )
+                continue
+
+            if key in records:
+                records[key].timestamp = call_record.timestamp
+                if key not in new_records:
+                    changed_records[key] = records[key]
+            else:
+                status = Status.PENDDING
+                if call_record.is_end():
+                    status = Status.COMPLETED
+                    self.__complete(records[start_key])
+                    if start_key not in new_records:
+                        changed_records[start_key] = records[start_key]
+
+                records[key] = new_records[key] = RecordInput(
+                    call_id=call_record.call_id,
+                    call_type=call_record.call_type.value,
+                    timestamp=call_record.timestamp,
+                    source=call_record.source,
+                    destination=call_record.destination,
+                    status=status,
+                )
+
+            processed[index] = (key, call_record.timestamp)
+
+        saved_records = self.call_record_repository.save_many(
+            list(new_records.values())
+        )
+        for key, saved_record in zip(new_records, saved_records):
+            records[key] = saved_record
+
+        self.call_record_repository.update_many(list(changed_records.values()))
+
+        self.__link_phone_bills(
+            records, {key[0] for key, _ in processed.values()}
+        )
+
+        self.call_record_repository.commit()
+
+        for index, (key, timestamp) in processed.items():
+            record = records[key]
+            results[index] = ItemOutput(
+                index=index,
+                record=Output(
+                    id=str(record.id),
+                    call_type=record.call_type,
+                    timestamp=timestamp,
+                    call_id=record.call_id,
+                    source=record.source,
+                    destination=record.destination,
+                ),
+            )
+
+        return results
+
+    @staticmethod
+    def __complete(record: RecordInput | RecordOutput) -> None:
+        if isinstance(record, RecordInput):
+            record.status = Status.COMPLETED
+        else:
+            record.status = Status.COMPLETED.value
+
+    def __link_phone_bills(
+        self,
+        records: Dict[Tuple[int, str], RecordOutput],
+        call_ids: Set[int],
+    ) -> None:
+        pairs = {}
+
+        for call_id in call_ids:
+            start_record = records.get((call_id, CallType.START.value))
+            end_record = records.get((call_id, CallType.END.value))
+
+            if not start_record or not end_record:
+                continue
+
+            if start_record.phone_bill_id or end_record.phone_bill_id:
+                continue
+
+            reference_period = end_record.timestamp.strftime('%m/%Y')
+            pairs.setdefault(
+                (start_record.source, reference_period), []
+            ).append((start_record, end_record))
+
+        if not pairs:
+            return
+
+        repository = self.phone_bill_repository
+        bills = repository.get_many_by_phone_number_and_reference_period(
+            list(pairs)
+        )
+        phone_bills = {
+            (bill.phone_number, bill.reference_period): bill for bill in bills
+        }
+        missing_keys = [key for key in pairs if key not in phone_bills]
+        saved_bills = repository.save_many([
+            PhoneBillInput(phone_number=key[0], reference_period=key[1])
+            for key in missing_keys
+        ])
+        phone_bills.update(zip(missing_keys, saved_bills))
+
+        phone_bill_ids = {}
+        for key, call_pairs in pairs.items():
+            for start_record, end_record in call_pairs:
+                phone_bill_ids[start_record.id] = phone_bills[key].id
+                phone_bill_ids[end_record.id] = phone_bills[key].id
+
+        self.call_record_repository.update_phone_bill_ids(phone_bill_ids)
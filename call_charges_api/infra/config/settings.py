@@ -13,3 +13,4 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    CALL_RECORDS_STREAM_CHUNK_SIZE: int = 500
@@ -1,7 +1,7 @@
-from typing import Tuple
+from typing import Dict, List, Tuple
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 
 from call_charges_api.infra.models.call_record import CallRecordModel
 from call_charges_api.repositories.call_record_repository import (
@@ -161,3 +161,92 @@ class SQLAlchemyCallRecordRepository(CallRecordRepository):
                 end_model.phone_bill_id = phone_bill_id
 
                 self.session.commit()
+
+    def get_many_by_call_ids(self, call_ids: List[int]) -> List[RecordOutput]:
+        if not call_ids:
+            return []
+
+        models = self.session.scalars(
+            select(CallRecordModel).where(
+                CallRecordModel.call_id.in_(call_ids)
+            )
+        ).all()
+
+        return [
+            RecordOutput(
+                id=model.id,
+                call_id=model.call_id,
+                call_type=model.type,
+                timestamp=model.timestamp,
+                source=model.source,
+                destination=model.destination,
+                status=model.status,
+                phone_bill_id=model.phone_bill_id,
+            )
+            for model in models
+        ]
+
+    def save_many(self, records: List[RecordInput]) -> List[RecordOutput]:
+        outputs = [
+            RecordOutput(
+                id=uuid4(),
+                call_id=record.call_id,
+                call_type=record.call_type,
+                timestamp=record.timestamp,
+                source=record.source,
+                destination=record.destination,
+                status=record.status.value,
+            )
+            for record in records
+        ]
+
+        if outputs:
+            self.session.execute(
+                insert(CallRecordModel),
+                [
+                    {
+                        'id': output.id,
+                        'call_id': output.call_id,
+                        'type': output.call_type,
+                        'timestamp': output.timestamp,
+                        'source': output.source,
+                        'destination': output.destination,
+                        'status': output.status,
+                        'phone_bill_id': None,
+                    }
+                    for output in outputs
+                ],
+            )
+
+        return outputs
+
+    def update_many(self, records: List[RecordOutput]) -> None:
+        if not records:
+            return
+
+        self.session.execute(
+            update(CallRecordModel),
+            [
+                {
+                    'id': record.id,
+                    'timestamp': record.timestamp,
+                    'status': record.status,
+                }
+                for record in records
+            ],
+        )
+
+    def update_phone_bill_ids(self, phone_bill_ids: Dict[UUID, UUID]) -> None:
+        if not phone_bill_ids:
+            return
+
+        self.session.execute(
+            update(CallRecordModel),
+            [
+                {'id': record_id, 'phone_bill_id': phone_bill_id}
+                for record_id, phone_bill_id in phone_bill_ids.items()
+            ],
+        )
+
+    def commit(self) -> None:
+        self.session.commit()
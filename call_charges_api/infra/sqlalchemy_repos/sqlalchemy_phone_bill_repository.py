@@ -1,7 +1,8 @@
 from collections import defaultdict
+from typing import List, Tuple
 from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, tuple_
 
 from call_charges_api.infra.models.call_record import CallRecordModel
 from call_charges_api.infra.models.phone_bill import PhoneBillModel
@@ -112,3 +113,56 @@ class SQLAlchemyPhoneBillRepository(PhoneBillRepository):
         )
 
         return bill is not None
+
+    def get_many_by_phone_number_and_reference_period(
+        self, keys: List[Tuple[str, str]]
+    ) -> List[PhoneBillOutput]:
+        if not keys:
+            return []
+
+        bills = self.session.scalars(
+            select(PhoneBillModel).where(
+                tuple_(
+                    PhoneBillModel.phone_number,
+                    PhoneBillModel.reference_period,
+                ).in_(keys)
+            )
+        ).all()
+
+        return [
+            PhoneBillOutput(
+                id=bill.id,
+                phone_number=bill.phone_number,
+                reference_period=bill.reference_period,
+                call_records=[],
+            )
+            for bill in bills
+        ]
+
+    def save_many(
+        self, phone_bills: List[PhoneBillInput]
+    ) -> List[PhoneBillOutput]:
+        outputs = [
+            PhoneBillOutput(
+                id=uuid4(),
+                phone_number=phone_bill.phone_number,
+                reference_period=phone_bill.reference_period,
+                call_records=[],
+            )
+            for phone_bill in phone_bills
+        ]
+
+        if outputs:
+            self.session.execute(
+                insert(PhoneBillModel),
+                [
+                    {
+                        'id': output.id,
+                        'phone_number': output.phone_number,
+                        'reference_period': output.reference_period,
+                    }
+                    for output in outputs
+                ],
+            )
+
+        return outputs
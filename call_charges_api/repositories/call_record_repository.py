@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 
@@ -29,6 +29,7 @@ class RecordOutput:
     source: str
     destination: str
     status: str
+    phone_bill_id: Optional[UUID] = None
 
 
 class CallRecordRepository(ABC):
@@ -71,3 +72,23 @@ class CallRecordRepository(ABC):
         self, call_start_id: int, call_end_id: int, phone_bill_id: UUID
     ) -> None:
         pass
+
+    @abstractmethod
+    def get_many_by_call_ids(self, call_ids: List[int]) -> List[RecordOutput]:
+        pass
+
+    @abstractmethod
+    def save_many(self, records: List[RecordInput]) -> List[RecordOutput]:
+        pass
+
+    @abstractmethod
+    def update_many(self, records: List[RecordOutput]) -> None:
+        pass
+
+    @abstractmethod
+    def update_phone_bill_ids(self, phone_bill_ids: Dict[UUID, UUID]) -> None:
+        pass
+
+    @abstractmethod
+    def commit(self) -> None:
+        pass
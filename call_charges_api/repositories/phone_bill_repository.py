@@ -53,3 +53,15 @@ class PhoneBillRepository(ABC):
         self, reference_period: str, phone_number: str
     ) -> bool:
         pass
+
+    @abstractmethod
+    def get_many_by_phone_number_and_reference_period(
+        self, keys: List[Tuple[str, str]]
+    ) -> List[PhoneBillOutput]:
+        pass
+
+    @abstractmethod
+    def save_many(
+        self, phone_bills: List[PhoneBillInput]
+    ) -> List[PhoneBillOutput]:
+        pass
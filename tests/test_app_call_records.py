@@ -1,3 +1,4 @@
+import json
 from http import HTTPStatus
 
 import pytest
@@ -460,3 +461,113 @@ def test_update_record_without_id(
     assert response.json().get('call_id') == valid_end_record.get('call_id')
     assert response.json().get('type') == valid_end_record.get('type')
     assert response.json().get('timestamp') == '2023-11-01T11:00:00'
+
+
+def test_register_batch_pairs_records(
+    client, token, valid_start_record, valid_end_record
+):
+    response = client.put(
+        'api/v1/call_records:batch',
+        headers={'Authorization': f'Bearer {token}'},
+        json=[valid_end_record, valid_start_record],
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    results = response.json()['results']
+    assert [result['index'] for result in results] == [0, 1]
+    assert results[0]['record']['type'] == 'end'
+    assert results[1]['record']['type'] == 'start'
+    assert results[1]['record']['source'] == valid_start_record['source']
+
+    response = client.get(
+        'api/v1/phone_bill',
+        headers={'Authorization': f'Bearer {token}'},
+        params={'phone_number': '1234567890', 'reference_period': '11/2023'},
+    )
+    assert response.json()['bills'][0]['total_amount'] == 'R$ 3,06'
+
+
+def test_register_batch_reports_item_errors(
+    client, token, valid_start_record, valid_end_record
+):
+    valid_end_record['call_id'] = 2
+    invalid_record = {**valid_start_record, 'call_id': 3, 'source': '123'}
+
+    response = client.put(
+        'api/v1/call_records:batch',
+        headers={'Authorization': f'Bearer {token}'},
+        json=[valid_start_record, valid_end_record, invalid_record],
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    results = response.json()['results']
+    assert results[0]['record']['call_id'] == 1
+    assert results[1]['error'] == {
+        'status_code': HTTPStatus.NOT_FOUND,
+        'error': 'StartCallRecordNotFound',
+        'message': 'Start call record with ID 2 was not found.',
+    }
+    assert results[2]['error']['error'] == 'InvalidPhoneNumber'
+
+
+def test_register_batch_updates_existing_record(
+    client, token, valid_start_record, valid_end_record
+):
+    response = client.put(
+        'api/v1/call_records',
+        headers={'Authorization': f'Bearer {token}'},
+        json=valid_start_record,
+    )
+    start_id = response.json().get('id')
+
+    valid_start_record['timestamp'] = '2023-11-01T10:10:00'
+
+    response = client.put(
+        'api/v1/call_records:batch',
+        headers={'Authorization': f'Bearer {token}'},
+        json=[valid_start_record, valid_end_record],
+    )
+
+    results = response.json()['results']
+    assert results[0]['record']['id'] == start_id
+    assert results[0]['record']['timestamp'] == '2023-11-01T10:10:00'
+
+    response = client.get(
+        'api/v1/phone_bill',
+        headers={'Authorization': f'Bearer {token}'},
+        params={'phone_number': '1234567890', 'reference_period': '11/2023'},
+    )
+    assert response.json()['bills'][0]['total_amount'] == 'R$ 2,16'
+
+
+def test_register_stream(client, token, valid_start_record, valid_end_record):
+    lines = [
+        json.dumps(valid_start_record),
+        '',
+        'not-json',
+        json.dumps(valid_end_record),
+    ]
+
+    response = client.post(
+        'api/v1/call_records:stream',
+        headers={'Authorization': f'Bearer {token}'},
+        params={'chunk_size': 2},
+        content='\n'.join(lines),
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [result['index'] for result in results] == [0, 2, 3]
+    assert results[0]['record']['type'] == 'start'
+    assert results[1]['error']['status_code'] == (
+        HTTPStatus.UNPROCESSABLE_ENTITY
+    )
+    assert results[2]['record']['type'] == 'end'
+
+    response = client.get(
+        'api/v1/phone_bill',
+        headers={'Authorization': f'Bearer {token}'},
+        params={'phone_number': '1234567890', 'reference_period': '11/2023'},
+    )
+    assert response.json()['bills'][0]['total_amount'] == 'R$ 3,06'